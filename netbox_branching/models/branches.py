@@ -494,8 +494,16 @@ class Branch(JobsMixin, PrimaryModel):
                     f"ALTER TABLE {schema_table} ALTER COLUMN id SET DEFAULT nextval(%s)", [sequence_name]
                 )
 
+                # Get the names of the sequences used for object ID allocations by all tables to be replicated
+                tables = get_tables_to_replicate()
+                cursor.execute(
+                    "SELECT table_name, pg_get_serial_sequence(table_name, 'id') FROM unnest(%s::text[]) AS table_name",
+                    [tables]
+                )
+                sequence_names = dict(cursor.fetchall())
+
                 # Replicate relevant tables from the main schema
-                for table in get_tables_to_replicate():
+                for table in tables:
                     main_table = f'public.{table}'
                     schema_table = f'{schema}.{table}'
                     logger.debug(f'Creating table {schema_table}')
@@ -507,14 +515,9 @@ class Branch(JobsMixin, PrimaryModel):
                     cursor.execute(
                         f"INSERT INTO {schema_table} SELECT * FROM {main_table}"
                     )
-                    # Get the name of the sequence used for object ID allocations
-                    cursor.execute(
-                        "SELECT pg_get_serial_sequence(%s, 'id')", [table]
-                    )
-                    sequence_name = cursor.fetchone()[0]
                     # Set the default value for the ID column to the sequence associated with the source table
                     cursor.execute(
-                        f"ALTER TABLE {schema_table} ALTER COLUMN id SET DEFAULT nextval(%s)", [sequence_name]
+                        f"ALTER TABLE {schema_table} ALTER COLUMN id SET DEFAULT nextval(%s)", [sequence_names[table]]
                     )
 
                 # Commit the transaction
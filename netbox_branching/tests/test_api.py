@@ -2,7 +2,6 @@ import json
 
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
-from django.db import connections
 from django.test import Client, TransactionTestCase
 from django.urls import reverse
 
@@ -11,10 +10,10 @@ from users.models import Token
 
 from netbox_branching.constants import COOKIE_NAME
 from netbox_branching.models import Branch
+from .utils import close_branch_connection, drop_branch_schemas
 
 
 class APITestCase(TransactionTestCase):
-    serialized_rollback = True
 
     def setUp(self):
         self.client = Client()
@@ -33,6 +32,7 @@ class APITestCase(TransactionTestCase):
         branch = Branch(name='Branch 1')
         branch.save(provision=False)
         branch.provision(user)
+        self.branch = branch
 
         # Create sites
         Site.objects.create(name='Site 1', slug='site-1')
@@ -41,8 +41,8 @@ class APITestCase(TransactionTestCase):
     def tearDown(self):
         # Manually tear down the dynamic connection created for the Branch to
         # ensure the test exits cleanly.
-        branch = Branch.objects.first()
-        connections[branch.connection_name].close()
+        close_branch_connection(self.branch)
+        drop_branch_schemas()
 
     def get_results(self, response):
         self.assertEqual(response.status_code, 200)
@@ -51,51 +51,28 @@ class APITestCase(TransactionTestCase):
             raise ValueError("Response content does not contain API results")
         return data['results']
 
-    def test_without_branch(self):
+    def test_site_list_branching(self):
         url = reverse('dcim-api:site-list')
-        response = self.client.get(url, **self.header)
-        results = self.get_results(response)
+        branch = self.branch
 
-        self.assertEqual(len(results), 1)
-        self.assertEqual(results[0]['name'], 'Site 1')
-
-    def test_with_branch_header(self):
-        url = reverse('dcim-api:site-list')
-        branch = Branch.objects.first()
-        self.assertIsNotNone(branch, "Branch was not created")
-
-        # Regular API query
-        response = self.client.get(url, **self.header)
-        results = self.get_results(response)
-        self.assertEqual(len(results), 1)
-        self.assertEqual(results[0]['name'], 'Site 1')
-
-        # Branch-aware API query
-        header = {
+        branch_header = {
             **self.header,
-            f'HTTP_X_NETBOX_BRANCH': branch.schema_id,
+            'HTTP_X_NETBOX_BRANCH': branch.schema_id,
         }
-        response = self.client.get(url, **header)
-        results = self.get_results(response)
-        self.assertEqual(len(results), 1)
-        self.assertEqual(results[0]['name'], 'Site 2')
-
-    def test_with_branch_cookie(self):
-        url = reverse('dcim-api:site-list')
-        branch = Branch.objects.first()
-        self.assertIsNotNone(branch, "Branch was not created")
-
-        # Regular API query
-        response = self.client.get(url, **self.header)
-        results = self.get_results(response)
-        self.assertEqual(len(results), 1)
-        self.assertEqual(results[0]['name'], 'Site 1')
-
-        # Branch-aware API query
-        self.client.cookies.load({
-            COOKIE_NAME: branch.schema_id,
-        })
-        response = self.client.get(url, **self.header)
-        results = self.get_results(response)
-        self.assertEqual(len(results), 1)
-        self.assertEqual(results[0]['name'], 'Site 2')
+        for mode, header, site_name in (
+            ('no-branch', self.header, 'Site 1'),
+            ('header', branch_header, 'Site 2'),
+            ('cookie', self.header, 'Site 2'),
+        ):
+            with self.subTest(mode=mode):
+                # Attach the branch cookie only for the cookie-based query
+                if mode == 'cookie':
+                    self.client.cookies.load({
+                        COOKIE_NAME: branch.schema_id,
+                    })
+                response = self.client.get(url, **header)
+                self.client.cookies.pop(COOKIE_NAME, None)
+
+                results = self.get_results(response)
+                self.assertEqual(len(results), 1)
+                self.assertEqual(results[0]['name'], site_name)
@@ -2,17 +2,20 @@ import re
 
 from django.core.exceptions import ValidationError
 from django.db import connection
-from django.test import TransactionTestCase, override_settings
+from django.test import TestCase, TransactionTestCase, override_settings
 
 from netbox_branching.choices import BranchStatusChoices
 from netbox_branching.constants import MAIN_SCHEMA
 from netbox_branching.models import Branch
 from netbox_branching.utilities import get_tables_to_replicate
-from .utils import fetchall, fetchone
+from .utils import drop_branch_schemas, get_table_counts
 
 
 class BranchTestCase(TransactionTestCase):
-    serialized_rollback = True
+
+    def tearDown(self):
+        # Clean up any branch schemas created by the test
+        drop_branch_schemas()
 
     def test_create_branch(self):
         branch = Branch(name='Branch 1')
@@ -25,32 +28,38 @@ class BranchTestCase(TransactionTestCase):
 
             # Check that the schema was created in the database
             cursor.execute(
-                "SELECT schema_name FROM information_schema.schemata WHERE schema_name=%s",
+                "SELECT EXISTS(SELECT 1 FROM information_schema.schemata WHERE schema_name=%s)",
                 [branch.schema_name]
             )
-            row = cursor.fetchone()
-            self.assertIsNotNone(row)
+            self.assertTrue(cursor.fetchone()[0])
 
             # Check that all expected tables exist in the schema
             cursor.execute(
-                "SELECT * FROM information_schema.tables WHERE table_schema=%s",
+                "SELECT table_name FROM information_schema.tables WHERE table_schema=%s",
                 [branch.schema_name]
             )
             tables_expected = {*tables_to_replicate, 'core_objectchange'}
-            tables_found = {row.table_name for row in fetchall(cursor)}
+            tables_found = {row[0] for row in cursor}
             self.assertSetEqual(tables_expected, tables_found)
 
             # Check that object counts match the main schema for each table
-            for table_name in tables_to_replicate:
-                cursor.execute(f"SELECT COUNT(id) FROM {MAIN_SCHEMA}.{table_name}")
-                main_count = fetchone(cursor).count
-                cursor.execute(f"SELECT COUNT(id) FROM {branch.schema_name}.{table_name}")
-                branch_count = fetchone(cursor).count
-                self.assertEqual(
-                    main_count,
-                    branch_count,
-                    msg=f"Table {table_name} object count differs from main schema"
-                )
+            main_counts = get_table_counts(cursor, MAIN_SCHEMA, tables_to_replicate)
+            branch_counts = get_table_counts(cursor, branch.schema_name, tables_to_replicate)
+            self.assertDictEqual(main_counts, branch_counts, msg="Table object counts differ from main schema")
+
+            # Check that the ID column of each table defaults to the sequence of its counterpart in the main schema
+            cursor.execute(
+                "SELECT table_name, column_default, format("
+                "'nextval(%%L::regclass)', pg_get_serial_sequence(format('%%I.%%I', %s, table_name), 'id')::regclass"
+                ") "
+                "FROM information_schema.columns "
+                "WHERE table_schema=%s AND column_name='id' AND table_name=ANY(%s)",
+                [MAIN_SCHEMA, branch.schema_name, tables_to_replicate]
+            )
+            id_defaults = {row[0]: (row[1], row[2]) for row in cursor}
+            self.assertSetEqual(set(id_defaults), set(tables_to_replicate))
+            for table, (column_default, expected_default) in id_defaults.items():
+                self.assertEqual(column_default, expected_default, msg=f"Incorrect ID column default for {table}")
 
     def test_delete_branch(self):
         branch = Branch(name='Branch 1')
@@ -62,11 +71,13 @@ class BranchTestCase(TransactionTestCase):
 
             # Check that the schema no longer exists in the database
             cursor.execute(
-                "SELECT schema_name FROM information_schema.schemata WHERE schema_name=%s",
+                "SELECT EXISTS(SELECT 1 FROM information_schema.schemata WHERE schema_name=%s)",
                 [branch.schema_name]
             )
-            row = fetchone(cursor)
-            self.assertIsNone(row)
+            self.assertFalse(cursor.fetchone()[0])
+
+
+class BranchModelTestCase(TestCase):
 
     def test_branch_schema_id(self):
         branch = Branch(name='Branch 1')
@@ -92,10 +103,11 @@ class BranchTestCase(TransactionTestCase):
             Branch(name='Branch 2', status=BranchStatusChoices.READY),
         ))
 
-        # Second active branch should be permitted (merged branches don't count)
+        # Second active branch should be permitted (merged branches don't count). Bulk creation
+        # avoids the provisioning job & signal handlers triggered by save().
         branch = Branch(name='Branch 3')
         branch.full_clean()
-        branch.save()
+        Branch.objects.bulk_create((branch,))
 
         # Attempting to create a third active branch should fail
         branch = Branch(name='Branch 4')
@@ -119,7 +131,7 @@ class BranchTestCase(TransactionTestCase):
         # Creating a second non-archived Branch should succeed
         branch = Branch(name='Branch 3')
         branch.full_clean()
-        branch.save(provision=False)
+        Branch.objects.bulk_create((branch,))
 
         # Creating a third non-archived Branch should fail
         branch = Branch(name='Branch 4')
@@ -1,19 +1,13 @@
-from django.db import connections
 from django.test import TransactionTestCase
 
 from dcim.models import DeviceRole, Site
 from netbox_branching.models import Branch
 
 from netbox_branching.utilities import activate_branch
+from .utils import close_branch_connection, drop_branch_schemas
 
 
 class QueryTestCase(TransactionTestCase):
-    serialized_rollback = True
-
-    def tearDown(self):
-        # Manually tear down the dynamic connection created for the Branch
-        branch = Branch.objects.first()
-        connections[branch.connection_name].close()
 
     def test_query(self):
         Site.objects.create(name='Site 1', slug='site-1')
@@ -22,6 +16,9 @@ class QueryTestCase(TransactionTestCase):
         branch = Branch(name='Branch 1')
         branch.schema_id = 'test1234'
         branch.save(provision=False)
+        # Cleanups run in reverse order: close the Branch's dynamic connection before dropping its schema
+        self.addCleanup(drop_branch_schemas)
+        self.addCleanup(close_branch_connection, branch)
         branch.provision(user=None)
 
         # Query for the objects in the main schema
@@ -15,10 +15,11 @@ class RequestTestCase(TestCase):
         branch = Branch(name='Branch 1')
         branch.status = BranchStatusChoices.READY  # Fake provisioning
         branch.save(provision=False)
+        cls.branch = branch
 
     @override_settings(LOGIN_REQUIRED=False)
     def test_activate_branch(self):
-        branch = Branch.objects.first()
+        branch = self.branch
 
         # Activate the Branch
         url = reverse('home')
@@ -34,7 +35,7 @@ class RequestTestCase(TestCase):
     @override_settings(LOGIN_REQUIRED=False)
     def test_deactivate_branch(self):
         # Attach the cookie to the test client
-        branch = Branch.objects.first()
+        branch = self.branch
         self.client.cookies.load({
             COOKIE_NAME: branch.schema_id,
         })
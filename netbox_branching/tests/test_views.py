@@ -49,4 +49,4 @@ class BranchTestCase(ViewTestCases.PrimaryObjectViewTestCase):
 
     def tearDown(self):
         # Clear jobs queue
-        get_queue('default').connection.flushall()
+        get_queue('default').empty()
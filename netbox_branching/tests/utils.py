@@ -1,25 +1,46 @@
-from collections import namedtuple
+from django.db import connection, connections
+from psycopg import sql
+
+from netbox.plugins import get_plugin_config
 
 __all__ = (
-    'fetchall',
-    'fetchone',
+    'close_branch_connection',
+    'drop_branch_schemas',
+    'get_table_counts',
 )
 
 
-def fetchall(cursor):
+def close_branch_connection(branch):
+    """
+    Close the dynamic connection for the given Branch and discard it from the connection handler.
+    """
+    connections[branch.connection_name].close()
+    del connections[branch.connection_name]
+
+
+def drop_branch_schemas():
     """
-    Map cursor.fetchall() into a list of named tuples for convenience.
+    Drop all branch schemas remaining in the database using a single statement.
     """
-    result = namedtuple('Result', [col[0] for col in cursor.description])
-    return [
-        result(*row) for row in cursor.fetchall()
-    ]
+    schema_prefix = get_plugin_config('netbox_branching', 'schema_prefix')
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT nspname FROM pg_namespace WHERE starts_with(nspname, %s)", [schema_prefix])
+        if schemas := [row[0] for row in cursor.fetchall()]:
+            cursor.execute(
+                sql.SQL("DROP SCHEMA IF EXISTS {} CASCADE").format(
+                    sql.SQL(', ').join(map(sql.Identifier, schemas))
+                )
+            )
 
 
-def fetchone(cursor):
+def get_table_counts(cursor, schema, tables):
     """
-    Map cursor.fetchone() into a named tuple for convenience.
+    Return a mapping of each table in the given schema to its row count, retrieved using a single query.
     """
-    if ret := cursor.fetchone():
-        result = namedtuple('Result', [col[0] for col in cursor.description])
-        return result(*ret)
+    query = sql.SQL(' UNION ALL ').join(
+        sql.SQL("SELECT {} AS table_name, COUNT(id) AS count FROM {}").format(
+            sql.Literal(table), sql.Identifier(schema, table)
+        ) for table in tables
+    )
+    cursor.execute(query)
+    return dict(cursor.fetchall())
@@ -11,7 +11,8 @@ DATABASE = {
     "PASSWORD": "netbox",
     "HOST": "localhost",
     "PORT": "",
-    "CONN_MAX_AGE": 300,
+    "CONN_MAX_AGE": 600,
+    "CONN_HEALTH_CHECKS": True,
 }
 
 PLUGINS = [